@@ -80,13 +80,14 @@ def _format_elimination_reason(
 
     if all(isinstance(reason, Lemma) for reason in reasons):
         lemma_reasons = [reason for reason in reasons if isinstance(reason, Lemma)]
-        if any(elim.value not in reason.domain for reason in lemma_reasons):
+        if any(not reason.domain >> elim.value & 1 for reason in lemma_reasons):
             return "because " + "; ".join(str(reason) for reason in reasons)
         domains = {reason.domain for reason in lemma_reasons}
         if len(domains) == 1:
             domain = next(iter(domains))
-            if len(domain) == 2:
-                values_text = ", ".join(str(value) for value in sorted(domain))
+            if domain.bit_count() == 2:
+                values = lemma_reasons[0].values
+                values_text = ", ".join(str(value) for value in values)
                 cells = _format_cells(tuple(reason.cell for reason in lemma_reasons))
                 return (
                     f"because in {elim.house}, {{{cells}}} have domain "
@@ -1,15 +1,19 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from sudologue.model.cell import Cell
 from sudologue.model.house import all_houses
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Board:
     """Immutable sudoku board state. Stores only placed values."""
 
     size: int
     cells: tuple[tuple[int | None, ...], ...]
+    _empty_cells: tuple[Cell, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _empty_bits: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if len(self.cells) != self.size:
@@ -63,23 +67,47 @@ class Board:
         row = list(rows[cell.row])
         row[cell.col] = value
         rows[cell.row] = tuple(row)
-        return Board(size=self.size, cells=tuple(rows))
+        board = Board(size=self.size, cells=tuple(rows))
+        # A placement only fills one cell, so carry the empty-cell scan
+        # forward instead of rescanning the whole grid on the next step.
+        empty = self._empty_cells
+        if empty is not None:
+            object.__setattr__(
+                board, "_empty_cells", tuple(c for c in empty if c != cell)
+            )
+        bits = self._empty_bits
+        if bits is not None:
+            bit = 1 << (cell.row * self.size + cell.col)
+            object.__setattr__(board, "_empty_bits", bits & ~bit)
+        return board
 
     @property
     def is_complete(self) -> bool:
         """True if all cells are filled."""
-        return all(
-            self.cells[r][c] is not None
-            for r in range(self.size)
-            for c in range(self.size)
-        )
+        return not self.empty_cells
 
     @property
     def empty_cells(self) -> tuple[Cell, ...]:
         """Return all empty cells in row-major scan order."""
-        result: list[Cell] = []
-        for r in range(self.size):
-            for c in range(self.size):
-                if self.cells[r][c] is None:
-                    result.append(Cell(r, c))
-        return tuple(result)
+        empty = self._empty_cells
+        if empty is None:
+            result: list[Cell] = []
+            for r in range(self.size):
+                for c in range(self.size):
+                    if self.cells[r][c] is None:
+                        result.append(Cell(r, c))
+            empty = tuple(result)
+            object.__setattr__(self, "_empty_cells", empty)
+        return empty
+
+    @property
+    def empty_bitboard(self) -> int:
+        """Return the empty cells as a bitboard: bit row*size+col is set iff empty."""
+        bits = self._empty_bits
+        if bits is None:
+            bits = 0
+            size = self.size
+            for cell in self.empty_cells:
+                bits |= 1 << (cell.row * size + cell.col)
+            object.__setattr__(self, "_empty_bits", bits)
+        return bits
@@ -145,9 +145,29 @@ class TestEmptyCells:
         # Cell(0,3) is filled, so next is Cell(1,0)
         assert empty[3] == Cell(1, 0)
 
+    def test_place_carries_empty_cells_forward(self) -> None:
+        board = Board.from_string("0001000230000000", size=4)
+        before = board.empty_cells
+        placed = board.place(Cell(0, 1), 2)
+        assert placed.empty_cells == tuple(c for c in before if c != Cell(0, 1))
+        fresh = Board(size=4, cells=placed.cells)
+        assert placed.empty_cells == fresh.empty_cells
+        assert placed == fresh
+
+    def test_empty_bitboard(self) -> None:
+        board = Board.from_string("1234341221434300", size=4)
+        assert board.empty_bitboard == (1 << 14) | (1 << 15)
+        placed = board.place(Cell(3, 2), 2)
+        assert placed.empty_bitboard == 1 << 15
+        assert placed.empty_bitboard == Board(size=4, cells=placed.cells).empty_bitboard
+
 
 class TestImmutability:
     def test_frozen(self) -> None:
         board = Board.from_string("0000000000000000", size=4)
         with pytest.raises(AttributeError):
             board.size = 9  # type: ignore[misc]
+
+    def test_no_instance_dict(self) -> None:
+        board = Board.from_string("0000000000000000", size=4)
+        assert not hasattr(board, "__dict__")
@@ -1,18 +1,49 @@
 from dataclasses import dataclass
 
+_CELL_CACHE: dict[tuple[int, int], "Cell"] = {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, eq=False, init=False)
 class Cell:
-    """A position on a sudoku board. 0-indexed."""
+    """A position on a sudoku board. 0-indexed.
+
+    Cells are interned: constructing the same (row, col) twice returns the
+    same instance, so equality is identity and the hash is a small int baked
+    in when the cell is first created. The display string is baked in too.
+    All attributes are set once in __new__; there is no __init__ to rewrite
+    the shared instance.
+    """
+
+    __slots__ = ("row", "col", "_hash", "_str")
 
     row: int
     col: int
 
-    def __post_init__(self) -> None:
-        if self.row < 0 or self.col < 0:
-            raise ValueError(
-                f"row and col must be non-negative, got ({self.row}, {self.col})"
-            )
+    def __new__(cls, row: int, col: int) -> "Cell":
+        cell = _CELL_CACHE.get((row, col))
+        if cell is None:
+            if row < 0 or col < 0:
+                raise ValueError(
+                    f"row and col must be non-negative, got ({row}, {col})"
+                )
+            # Equal keys such as (True, 0) or (1.0, 0) share the canonical
+            # cell, so store plain ints in it.
+            row, col = int(row), int(col)
+            cell = object.__new__(cls)
+            object.__setattr__(cell, "row", row)
+            object.__setattr__(cell, "col", col)
+            object.__setattr__(cell, "_hash", (row << 16) | col)
+            object.__setattr__(cell, "_str", f"({row},{col})")
+            # Equality is identity, so racing creators must all get the
+            # instance that won: setdefault is atomic, get-then-set is not.
+            cell = _CELL_CACHE.setdefault((row, col), cell)
+        return cell
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[type["Cell"], tuple[int, int]]:
+        return (Cell, (self.row, self.col))
 
     def __str__(self) -> str:
-        return f"({self.row},{self.col})"
+        return self._str
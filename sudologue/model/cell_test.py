@@ -1,3 +1,7 @@
+import copy
+import dataclasses
+import pickle
+
 import pytest
 
 from sudologue.model.cell import Cell
@@ -51,6 +55,56 @@ class TestCellImmutability:
             cell.row = 1  # type: ignore[misc]
 
 
+class TestCellInterning:
+    def test_same_position_same_instance(self) -> None:
+        assert Cell(1, 2) is Cell(1, 2)
+
+    def test_different_positions_distinct(self) -> None:
+        assert Cell(1, 2) is not Cell(2, 1)
+
+    def test_equality_is_identity(self) -> None:
+        a = Cell(2, 2)
+        b = Cell(2, 2)
+        assert a == b
+        assert a is b
+
+    def test_hash_distinguishes_positions(self) -> None:
+        assert hash(Cell(1, 2)) != hash(Cell(2, 1))
+
+    def test_copy_preserves_identity(self) -> None:
+        cell = Cell(3, 1)
+        assert copy.copy(cell) is cell
+        assert copy.deepcopy(cell) is cell
+
+    def test_equal_non_int_arguments_leave_canonical_cell_intact(self) -> None:
+        cell = Cell(1, 0)
+        assert Cell(True, 0) is cell
+        assert Cell(1.0, 0) is cell  # type: ignore[arg-type]
+        assert type(cell.row) is int
+        assert repr(cell) == "Cell(row=1, col=0)"
+
+    def test_first_construction_stores_ints(self) -> None:
+        cell = Cell(7.0, 7)  # type: ignore[arg-type]
+        assert type(cell.row) is int
+        assert cell is Cell(7, 7)
+
+    def test_fields_are_row_and_col_only(self) -> None:
+        assert dataclasses.astuple(Cell(0, 1)) == (0, 1)
+
+    def test_pickle_round_trip_preserves_identity(self) -> None:
+        cell = Cell(0, 2)
+        assert pickle.loads(pickle.dumps(cell)) is cell
+
+    def test_no_instance_dict(self) -> None:
+        assert not hasattr(Cell(1, 1), "__dict__")
+
+
 class TestCellStr:
     def test_str(self) -> None:
         assert str(Cell(2, 3)) == "(2,3)"
+
+    def test_str_is_cached(self) -> None:
+        assert str(Cell(4, 5)) is str(Cell(4, 5))
+
+    def test_repr_omits_cached_fields(self) -> None:
+        assert repr(Cell(2, 3)) == "Cell(row=2, col=3)"
@@ -1,6 +1,7 @@
 import math
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 
 from sudologue.model.cell import Cell
 
@@ -53,8 +54,12 @@ def _box_size(size: int) -> int:
     return bs
 
 
+@cache
 def all_houses(size: int) -> tuple[House, ...]:
-    """Generate all houses (rows, columns, boxes) for a board of given size."""
+    """Generate all houses (rows, columns, boxes) for a board of given size.
+
+    Houses are immutable, so the tuple is built once per size and shared.
+    """
     bs = _box_size(size)
     houses: list[House] = []
 
@@ -77,6 +82,19 @@ def all_houses(size: int) -> tuple[House, ...]:
     return tuple(houses)
 
 
+@cache
+def house_cell_indices(size: int) -> tuple[tuple[int, ...], ...]:
+    """Return each house's cells as flat row-major indices (row*size+col).
+
+    The tuples are parallel to all_houses(size), so hot loops can index flat
+    board data without touching Cell attributes.
+    """
+    return tuple(
+        tuple(cell.row * size + cell.col for cell in house.cells)
+        for house in all_houses(size)
+    )
+
+
 def houses_for(cell: Cell, size: int) -> tuple[House, ...]:
     """Return the houses containing the given cell."""
     return tuple(h for h in all_houses(size) if cell in h.cells)
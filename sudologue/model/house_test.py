@@ -1,7 +1,14 @@
 import pytest
 
 from sudologue.model.cell import Cell
-from sudologue.model.house import House, HouseType, all_houses, houses_for, peers
+from sudologue.model.house import (
+    House,
+    HouseType,
+    all_houses,
+    house_cell_indices,
+    houses_for,
+    peers,
+)
 
 
 class TestHouseConstruction:
@@ -88,6 +95,15 @@ class TestAllHouses9x9:
             assert len(house.cells) == 9
 
 
+class TestAllHousesCaching:
+    def test_same_size_returns_same_tuple(self) -> None:
+        assert all_houses(4) is all_houses(4)
+
+    def test_sizes_cached_independently(self) -> None:
+        assert len(all_houses(4)) == 12
+        assert len(all_houses(9)) == 27
+
+
 class TestInvalidSize:
     def test_non_perfect_square(self) -> None:
         with pytest.raises(ValueError, match="perfect square"):
@@ -143,3 +159,12 @@ class TestPeers:
         # (0,0) and (3,3) are in different rows, cols, and boxes on 4x4
         # Box 0 = {(0,0),(0,1),(1,0),(1,1)}, Box 3 = {(2,2),(2,3),(3,2),(3,3)}
         assert Cell(3, 3) not in peers(Cell(0, 0), 4)
+
+
+class TestHouseCellIndices:
+    def test_parallel_to_all_houses(self) -> None:
+        for house, indices in zip(all_houses(4), house_cell_indices(4), strict=True):
+            assert indices == tuple(c.row * 4 + c.col for c in house.cells)
+
+    def test_cached(self) -> None:
+        assert house_cell_indices(9) is house_cell_indices(9)
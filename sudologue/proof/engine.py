@@ -1,9 +1,25 @@
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from types import MappingProxyType
 
 from sudologue.model.board import Board
 from sudologue.model.cell import Cell
-from sudologue.model.house import CellHouse, HouseType, all_houses
-from sudologue.proof.proposition import Axiom, Candidate, Elimination, Lemma, RangeLemma
+from sudologue.model.house import (
+    CellHouse,
+    House,
+    HouseType,
+    all_houses,
+    house_cell_indices,
+)
+from sudologue.proof.proposition import (
+    Axiom,
+    Candidate,
+    Elimination,
+    Lemma,
+    RangeLemma,
+    bitmask,
+)
 
 
 @dataclass(frozen=True)
@@ -16,6 +32,13 @@ class Derivation:
     lemmas: tuple[Lemma, ...]
     range_lemmas: tuple[RangeLemma, ...]
     candidates: tuple[Candidate, ...]
+    house_range_lemmas: tuple[RangeLemma, ...]
+    cell_range_lemmas: tuple[RangeLemma, ...]
+    elimination_index: Mapping[int, Elimination] = field(repr=False, compare=False)
+
+    def elimination_for(self, cell: Cell, value: int) -> Elimination | None:
+        """Return the elimination proving cell ≠ value, if one was derived."""
+        return self.elimination_index.get(_elim_key(self.size, cell, value))
 
 
 def derive(board: Board) -> Derivation:
@@ -23,22 +46,27 @@ def derive(board: Board) -> Derivation:
     axioms = _extract_axioms(board)
     axiom_by_cell: dict[Cell, Axiom] = {ax.cell: ax for ax in axioms}
     eliminations = _derive_eliminations(board, axiom_by_cell)
+    elim_by_key = _index_eliminations(board.size, eliminations)
     lemmas: tuple[Lemma, ...] = ()
+    house_ranges: tuple[RangeLemma, ...] = ()
+    cell_ranges: tuple[RangeLemma, ...] = ()
     range_lemmas: tuple[RangeLemma, ...] = ()
 
     while True:
         lemmas = _derive_lemmas(board, eliminations)
-        range_lemmas = _derive_ranges(board, eliminations)
+        house_ranges, cell_ranges = _derive_ranges(board.size, lemmas, elim_by_key)
+        range_lemmas = house_ranges + cell_ranges
         pair_elims = _derive_pair_eliminations(
             board.size, lemmas, range_lemmas, eliminations
         )
         point_elims = _derive_pointing_eliminations(
-            board.size, lemmas, range_lemmas, eliminations + pair_elims
+            board.size, lemmas, house_ranges, eliminations + pair_elims
         )
         new_elims = pair_elims + point_elims
         if not new_elims:
             break
         eliminations = eliminations + new_elims
+        elim_by_key.update(_index_eliminations(board.size, new_elims))
 
     candidates = _derive_candidates(lemmas)
     return Derivation(
@@ -48,6 +76,9 @@ def derive(board: Board) -> Derivation:
         lemmas=lemmas,
         range_lemmas=range_lemmas,
         candidates=candidates,
+        house_range_lemmas=house_ranges,
+        cell_range_lemmas=cell_ranges,
+        elimination_index=elim_by_key,
     )
 
 
@@ -66,24 +97,41 @@ def _derive_eliminations(
     board: Board, axiom_by_cell: dict[Cell, Axiom]
 ) -> tuple[Elimination, ...]:
     """For each axiom, eliminate its value from all empty peer cells."""
-    seen: set[tuple[int, int, int]] = set()
+    size = board.size
+    # Per value, a bitboard (bit row*size+col) of cells already eliminated.
+    seen = [0] * (size + 1)
     result: list[Elimination] = []
-
-    for house in all_houses(board.size):
+    append = result.append
+    # Every elimination from an axiom shares one premises tuple.
+    premises_by_cell = {cell: (axiom,) for cell, axiom in axiom_by_cell.items()}
+
+    board_empty = board.empty_bitboard
+    bitboards = _house_bitboards(size)
+
+    for house, indices in zip(all_houses(size), house_cell_indices(size), strict=True):
+        # A single AND against the board's empty bitboard skips solved
+        # houses outright; otherwise resolve the house's empty cells and their
+        # bits once, so each axiom finds its fresh targets with another AND.
+        empty_bits = bitboards[house.house_type][house.index] & board_empty
+        if not empty_bits:
+            continue
+        empty = [
+            (peer, bit)
+            for peer, index in zip(house.cells, indices, strict=True)
+            if empty_bits & (bit := 1 << index)
+        ]
         for cell in house.cells:
-            axiom = axiom_by_cell.get(cell)
-            if axiom is None:
+            premises = premises_by_cell.get(cell)
+            if premises is None:
                 continue
-            for peer in house.cells:
-                if peer == cell:
-                    continue
-                if board.value_at(peer) is not None:
-                    continue
-                key = (peer.row, peer.col, axiom.value)
-                if key in seen:
-                    continue
-                seen.add(key)
-                result.append(Elimination(peer, axiom.value, house, (axiom,)))
+            value = premises[0].value
+            fresh = empty_bits & ~seen[value]
+            if not fresh:
+                continue
+            seen[value] |= fresh
+            for peer, bit in empty:
+                if fresh & bit:
+                    append(Elimination(peer, value, house, premises))
 
     return tuple(result)
 
@@ -96,52 +144,113 @@ def _derive_lemmas(
     for elim in eliminations:
         elims_by_cell.setdefault(elim.cell, []).append(elim)
 
-    full_domain = frozenset(range(1, board.size + 1))
+    full_domain = bitmask(range(1, board.size + 1))
     result: list[Lemma] = []
 
     for cell in board.empty_cells:
         cell_elims = elims_by_cell.get(cell, [])
-        eliminated_values = frozenset(e.value for e in cell_elims)
-        domain = full_domain - eliminated_values
+        domain = full_domain & ~bitmask(e.value for e in cell_elims)
         result.append(Lemma(cell, domain, tuple(cell_elims)))
 
     return tuple(result)
 
 
+def _elim_base(size: int, cell: Cell) -> int:
+    """Return the elimination key offset shared by every value of a cell."""
+    return (cell.row * size + cell.col) * (size + 1)
+
+
+def _elim_key(size: int, cell: Cell, value: int) -> int:
+    """Flatten a (cell, value) pair into a single int for cheap dict probes."""
+    return _elim_base(size, cell) + value
+
+
+def _index_eliminations(
+    size: int, eliminations: tuple[Elimination, ...]
+) -> dict[int, Elimination]:
+    """Index eliminations by their flattened (cell, value) key."""
+    return {_elim_key(size, elim.cell, elim.value): elim for elim in eliminations}
+
+
 def _derive_ranges(
-    board: Board, eliminations: tuple[Elimination, ...]
-) -> tuple[RangeLemma, ...]:
-    """For each house and value, compute the remaining candidate cells."""
-    elim_by_cell_value: dict[tuple[Cell, int], Elimination] = {
-        (elim.cell, elim.value): elim for elim in eliminations
-    }
+    size: int, lemmas: tuple[Lemma, ...], elim_by_key: dict[int, Elimination]
+) -> tuple[tuple[RangeLemma, ...], tuple[RangeLemma, ...]]:
+    """For each house and value, compute the remaining candidate cells.
+
+    Returns the row/column/box ranges and the cell-house ranges separately.
+    Cell-house ranges are emitted contiguously per cell, in value order, with
+    cells in the same scan order as the domain lemmas.
+    """
+    values = range(1, size + 1)
     result: list[RangeLemma] = []
-
-    for house in all_houses(board.size):
-        empty_cells = [cell for cell in house.cells if board.value_at(cell) is None]
+    cell_result: list[RangeLemma] = []
+
+    # Probe the index once per (cell, value); every house containing the cell
+    # then reads the dense per-cell row, indexed directly by value. The
+    # lemma's domain already is the cell's candidate bitmask (bit v set iff v
+    # is not eliminated), so it is reused rather than rebuilt.
+    elims_by_cell: dict[Cell, list[Elimination | None]] = {}
+    masks: dict[Cell, int] = {}
+    for lemma in lemmas:
+        cell = lemma.cell
+        base = _elim_base(size, cell)
+        cell_elims: list[Elimination | None] = [None]
+        cell_elims += [elim_by_key.get(base + v) for v in values]
+        elims_by_cell[cell] = cell_elims
+        masks[cell] = lemma.domain
+
+    for house in all_houses(size):
+        empty_cells = [
+            (cell, elims_by_cell[cell], masks[cell])
+            for cell in house.cells
+            if cell in masks
+        ]
         if not empty_cells:
             continue
-        for value in range(1, board.size + 1):
+        # Reduce the house's masks once. A value outside the union is
+        # eliminated from every cell, and a value in the intersection is open
+        # in every cell; neither range needs a per-cell branch.
+        union = 0
+        common = -1
+        for _cell, _elims, mask in empty_cells:
+            union |= mask
+            common &= mask
+        open_cells: tuple[Cell, ...] | None = None
+        for value in values:
+            if not union >> value & 1:
+                eliminated = tuple(
+                    elim
+                    for _cell, cell_elims, _mask in empty_cells
+                    if (elim := cell_elims[value]) is not None
+                )
+                result.append(RangeLemma(house, value, (), eliminated))
+                continue
+            if common >> value & 1:
+                if open_cells is None:
+                    open_cells = tuple(cell for cell, _elims, _mask in empty_cells)
+                result.append(RangeLemma(house, value, open_cells, ()))
+                continue
             cells: list[Cell] = []
             premises: list[Elimination] = []
-            for cell in empty_cells:
-                elim = elim_by_cell_value.get((cell, value))
+            for cell, cell_elims, _mask in empty_cells:
+                elim = cell_elims[value]
                 if elim is None:
                     cells.append(cell)
                 else:
                     premises.append(elim)
             result.append(RangeLemma(house, value, tuple(cells), tuple(premises)))
 
-    for cell in board.empty_cells:
-        cell_house = CellHouse(cell, board.size)
-        for value in range(1, board.size + 1):
-            elim = elim_by_cell_value.get((cell, value))
+    for cell, cell_elims in elims_by_cell.items():
+        cell_house = CellHouse(cell, size)
+        only_cell = (cell,)
+        for value in values:
+            elim = cell_elims[value]
             if elim is None:
-                result.append(RangeLemma(cell_house, value, (cell,), ()))
+                cell_result.append(RangeLemma(cell_house, value, only_cell, ()))
             else:
-                result.append(RangeLemma(cell_house, value, (), (elim,)))
+                cell_result.append(RangeLemma(cell_house, value, (), (elim,)))
 
-    return tuple(result)
+    return tuple(result), tuple(cell_result)
 
 
 def _derive_pair_eliminations(
@@ -154,64 +263,121 @@ def _derive_pair_eliminations(
     return ()
 
 
+@cache
+def _house_bitboards(size: int) -> Mapping[HouseType, tuple[int, ...]]:
+    """Return each house's cells as a bitboard (bit row*size+col), by index.
+
+    The result is cached and shared by every caller, so it is read-only.
+    """
+    boards: dict[HouseType, list[int]] = {
+        HouseType.ROW: [0] * size,
+        HouseType.COLUMN: [0] * size,
+        HouseType.BOX: [0] * size,
+    }
+    for house, indices in zip(all_houses(size), house_cell_indices(size), strict=True):
+        bits = 0
+        for index in indices:
+            bits |= 1 << index
+        boards[house.house_type][house.index] = bits
+    return MappingProxyType(
+        {house_type: tuple(bits) for house_type, bits in boards.items()}
+    )
+
+
+@cache
+def _board_cells(size: int) -> tuple[Cell, ...]:
+    """Return every cell in row-major order, indexed by bitboard position."""
+    return tuple(Cell(r, c) for r in range(size) for c in range(size))
+
+
+def _bitboard_cells(bits: int, cells: tuple[Cell, ...]) -> list[Cell]:
+    """Return the cells whose bits are set, lowest bit first."""
+    result: list[Cell] = []
+    while bits:
+        low = bits & -bits
+        result.append(cells[low.bit_length() - 1])
+        bits ^= low
+    return result
+
+
 def _derive_pointing_eliminations(
     size: int,
     lemmas: tuple[Lemma, ...],
     range_lemmas: tuple[RangeLemma, ...],
     eliminations: tuple[Elimination, ...],
 ) -> tuple[Elimination, ...]:
-    """Derive eliminations from pointing pairs and box-line reductions."""
+    """Derive eliminations from pointing pairs and box-line reductions.
+
+    Each value's open cells are tracked as a bitboard: bit row*size+col is
+    set iff the cell is empty and no elimination of the value is known for
+    it yet. The targets of a pointing or claiming range are then a single
+    AND against the line or box bitboard.
+    """
     if size == 0:
         return ()
 
-    existing_keys = {(elim.cell, elim.value) for elim in eliminations}
-    lemmas_by_cell = {lemma.cell: lemma for lemma in lemmas}
-    results: list[Elimination] = []
+    empty_bits = 0
+    for lemma in lemmas:
+        cell = lemma.cell
+        empty_bits |= 1 << (cell.row * size + cell.col)
+    open_cells = [empty_bits] * (size + 1)
+    for elim in eliminations:
+        cell = elim.cell
+        open_cells[elim.value] &= ~(1 << (cell.row * size + cell.col))
 
+    results: list[Elimination] = []
     houses = all_houses(size)
     row_houses = {h.index: h for h in houses if h.house_type == HouseType.ROW}
     col_houses = {h.index: h for h in houses if h.house_type == HouseType.COLUMN}
     box_houses = {h.index: h for h in houses if h.house_type == HouseType.BOX}
+    bitboards = _house_bitboards(size)
+    row_bits = bitboards[HouseType.ROW]
+    col_bits = bitboards[HouseType.COLUMN]
+    box_bits = bitboards[HouseType.BOX]
+    board_cells = _board_cells(size)
 
     box_size = int(size**0.5)
 
     def box_index(cell: Cell) -> int:
         return (cell.row // box_size) * box_size + (cell.col // box_size)
 
+    def bits_of(range_lemma: RangeLemma) -> int:
+        range_bits = 0
+        for cell in range_lemma.cells:
+            range_bits |= 1 << (cell.row * size + cell.col)
+        return range_bits
+
+    def eliminate(
+        range_lemma: RangeLemma, range_bits: int, house: House, house_bits: int
+    ) -> None:
+        value = range_lemma.value
+        targets = open_cells[value] & house_bits & ~range_bits
+        if not targets:
+            return
+        open_cells[value] &= ~targets
+        premises = (range_lemma,)
+        results.extend(
+            Elimination(cell, value, house, premises)
+            for cell in _bitboard_cells(targets, board_cells)
+        )
+
+    # A range is confined to a line or box iff its bitboard has no bits
+    # outside that house's bitboard, so no per-range sets are built.
+
     # Pointing: box -> row/column
     for range_lemma in range_lemmas:
         if range_lemma.house.house_type != HouseType.BOX or not range_lemma.cells:
             continue
-        rows = {cell.row for cell in range_lemma.cells}
-        cols = {cell.col for cell in range_lemma.cells}
-
-        if len(rows) == 1:
-            row_idx = next(iter(rows))
-            row_house = row_houses[row_idx]
-            for cell in row_house.cells:
-                if cell in range_lemma.cells or cell not in lemmas_by_cell:
-                    continue
-                key = (cell, range_lemma.value)
-                if key in existing_keys:
-                    continue
-                existing_keys.add(key)
-                results.append(
-                    Elimination(cell, range_lemma.value, row_house, (range_lemma,))
-                )
+        range_bits = bits_of(range_lemma)
+        first = range_lemma.cells[0]
 
-        if len(cols) == 1:
-            col_idx = next(iter(cols))
-            col_house = col_houses[col_idx]
-            for cell in col_house.cells:
-                if cell in range_lemma.cells or cell not in lemmas_by_cell:
-                    continue
-                key = (cell, range_lemma.value)
-                if key in existing_keys:
-                    continue
-                existing_keys.add(key)
-                results.append(
-                    Elimination(cell, range_lemma.value, col_house, (range_lemma,))
-                )
+        row_idx = first.row
+        if not range_bits & ~row_bits[row_idx]:
+            eliminate(range_lemma, range_bits, row_houses[row_idx], row_bits[row_idx])
+
+        col_idx = first.col
+        if not range_bits & ~col_bits[col_idx]:
+            eliminate(range_lemma, range_bits, col_houses[col_idx], col_bits[col_idx])
 
     # Claiming: row/column -> box
     for range_lemma in range_lemmas:
@@ -219,21 +385,11 @@ def _derive_pointing_eliminations(
             continue
         if not range_lemma.cells:
             continue
-        boxes = {box_index(cell) for cell in range_lemma.cells}
-        if len(boxes) != 1:
+        range_bits = bits_of(range_lemma)
+        box_idx = box_index(range_lemma.cells[0])
+        if range_bits & ~box_bits[box_idx]:
             continue
-        box_idx = next(iter(boxes))
-        box_house = box_houses[box_idx]
-        for cell in box_house.cells:
-            if cell in range_lemma.cells or cell not in lemmas_by_cell:
-                continue
-            key = (cell, range_lemma.value)
-            if key in existing_keys:
-                continue
-            existing_keys.add(key)
-            results.append(
-                Elimination(cell, range_lemma.value, box_house, (range_lemma,))
-            )
+        eliminate(range_lemma, range_bits, box_houses[box_idx], box_bits[box_idx])
 
     return tuple(results)
 
@@ -251,7 +407,9 @@ def derive_pointing_eliminations(
 def _derive_candidates(lemmas: tuple[Lemma, ...]) -> tuple[Candidate, ...]:
     """Create candidate propositions from domain lemmas."""
     result: list[Candidate] = []
+    extend = result.extend
     for lemma in lemmas:
-        for value in sorted(lemma.domain):
-            result.append(Candidate(lemma.cell, value, (lemma,)))
+        cell = lemma.cell
+        premises = (lemma,)
+        extend([Candidate(cell, value, premises) for value in lemma.values])
     return tuple(result)
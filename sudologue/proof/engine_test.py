@@ -2,7 +2,14 @@ from sudologue.model.board import Board
 from sudologue.model.cell import Cell
 from sudologue.model.house import HouseType, all_houses
 from sudologue.proof.engine import derive, derive_pointing_eliminations
-from sudologue.proof.proposition import Axiom, Candidate, Lemma, RangeLemma
+from sudologue.proof.proposition import (
+    Axiom,
+    Candidate,
+    Elimination,
+    Lemma,
+    RangeLemma,
+    bitmask,
+)
 
 
 class TestExtractAxioms:
@@ -92,6 +99,12 @@ class TestDeriveEliminations:
         # All eliminations cite the same axiom instance
         assert len(axiom_ids) == 1
 
+    def test_premise_tuple_sharing(self) -> None:
+        """Eliminations from the same axiom share one premises tuple."""
+        board = Board.from_string("1000000000000000", size=4)
+        d = derive(board)
+        assert len({id(e.premises) for e in d.eliminations}) == 1
+
 
 class TestDeriveLemmas:
     def test_empty_board_full_domains(self) -> None:
@@ -99,7 +112,7 @@ class TestDeriveLemmas:
         d = derive(board)
         assert len(d.lemmas) == 16
         for lemma in d.lemmas:
-            assert lemma.domain == frozenset({1, 2, 3, 4})
+            assert lemma.domain == bitmask({1, 2, 3, 4})
             assert len(lemma.premises) == 0
 
     def test_singleton_domain(self) -> None:
@@ -107,7 +120,7 @@ class TestDeriveLemmas:
         board = Board.from_string("0001000230000000", size=4)
         d = derive(board)
         lemma_23 = next(lem for lem in d.lemmas if lem.cell == Cell(2, 3))
-        assert lemma_23.domain == frozenset({4})
+        assert lemma_23.domain == bitmask({4})
 
     def test_domain_premises_are_eliminations(self) -> None:
         board = Board.from_string("0001000230000000", size=4)
@@ -124,7 +137,7 @@ class TestDeriveLemmas:
         # Cell (3,3) is in col 3 (has 1, 2) and box 3 (no other givens there)
         # and row 3 (no givens). So eliminations: ≠1, ≠2. Domain = {3, 4}.
         lemma_33 = next(lem for lem in d.lemmas if lem.cell == Cell(3, 3))
-        assert lemma_33.domain == frozenset({3, 4})
+        assert lemma_33.domain == bitmask({3, 4})
 
     def test_lemmas_in_scan_order(self) -> None:
         board = Board.from_string("0001000230000000", size=4)
@@ -161,6 +174,87 @@ class TestDeriveRanges:
         premise_cells = {elim.cell for elim in range_lemma.premises}
         assert premise_cells == {Cell(3, 0), Cell(3, 1), Cell(3, 2)}
 
+    def test_range_for_value_outside_house_union(self) -> None:
+        # Row 0 already holds 1, so every empty cell in it eliminates 1.
+        board = Board.from_string("1200001221000000", size=4)
+        d = derive(board)
+        range_lemma = next(
+            rl
+            for rl in d.house_range_lemmas
+            if rl.house.house_type == HouseType.ROW
+            and rl.house.index == 0
+            and rl.value == 1
+        )
+        assert range_lemma.cells == ()
+        assert [elim.cell for elim in range_lemma.premises] == [Cell(0, 2), Cell(0, 3)]
+
+    def test_ranges_open_in_every_cell_share_cells(self) -> None:
+        board = Board.from_string("0000000000000000", size=4)
+        d = derive(board)
+        row0 = [
+            rl
+            for rl in d.house_range_lemmas
+            if rl.house.house_type == HouseType.ROW and rl.house.index == 0
+        ]
+        assert [rl.value for rl in row0] == [1, 2, 3, 4]
+        assert all(rl.cells == tuple(Cell(0, c) for c in range(4)) for rl in row0)
+        assert all(rl.premises == () for rl in row0)
+        assert all(rl.cells is row0[0].cells for rl in row0)
+
+
+class TestEliminationLookup:
+    def test_finds_derived_elimination(self) -> None:
+        board = Board.from_string("0001000230000000", size=4)
+        d = derive(board)
+        elim = d.elimination_for(Cell(2, 3), 1)
+        assert elim is not None
+        assert elim.cell == Cell(2, 3)
+        assert elim.value == 1
+        assert elim in d.eliminations
+
+    def test_missing_elimination(self) -> None:
+        board = Board.from_string("0001000230000000", size=4)
+        d = derive(board)
+        assert d.elimination_for(Cell(2, 3), 4) is None
+
+    def test_index_covers_all_eliminations(self) -> None:
+        board = Board.from_string("1200001221000000", size=4)
+        d = derive(board)
+        assert len(d.elimination_index) == len(d.eliminations)
+        for elim in d.eliminations:
+            assert d.elimination_for(elim.cell, elim.value) is elim
+
+
+class TestCellRangeSharing:
+    def test_candidate_ranges_share_cells_tuple(self) -> None:
+        board = Board.from_string("0000000000000000", size=4)
+        d = derive(board)
+        first = [rl for rl in d.cell_range_lemmas if rl.house.cells[0] == Cell(0, 0)]
+        assert len(first) == 4
+        assert len({id(rl.cells) for rl in first}) == 1
+
+
+class TestRangePartitions:
+    def test_partitions_cover_all_ranges(self) -> None:
+        board = Board.from_string("0001000230000000", size=4)
+        d = derive(board)
+        assert d.range_lemmas == d.house_range_lemmas + d.cell_range_lemmas
+
+    def test_partitions_split_by_house_type(self) -> None:
+        board = Board.from_string("0001000230000000", size=4)
+        d = derive(board)
+        assert all(rl.house.house_type != HouseType.CELL for rl in d.house_range_lemmas)
+        assert all(rl.house.house_type == HouseType.CELL for rl in d.cell_range_lemmas)
+
+    def test_cell_ranges_align_with_lemmas(self) -> None:
+        board = Board.from_string("0001000230000000", size=4)
+        d = derive(board)
+        assert len(d.cell_range_lemmas) == 4 * len(d.lemmas)
+        for i, lemma in enumerate(d.lemmas):
+            ranges = d.cell_range_lemmas[i * 4 : (i + 1) * 4]
+            assert all(rl.house.cells == (lemma.cell,) for rl in ranges)
+            assert tuple(rl.value for rl in ranges if rl.cells) == lemma.values
+
 
 class TestDeriveCandidates:
     def test_candidates_from_singleton_domain(self) -> None:
@@ -179,8 +273,8 @@ class TestDerivePointing:
         )
         range_lemma = RangeLemma(box, 1, (Cell(0, 0), Cell(0, 1)), ())
         lemmas = (
-            Lemma(Cell(0, 2), frozenset({1, 2, 3, 4}), ()),
-            Lemma(Cell(0, 3), frozenset({1, 2, 3, 4}), ()),
+            Lemma(Cell(0, 2), bitmask({1, 2, 3, 4}), ()),
+            Lemma(Cell(0, 3), bitmask({1, 2, 3, 4}), ()),
         )
         eliminations = derive_pointing_eliminations(4, lemmas, (range_lemma,), ())
         elim_keys = {(elim.cell, elim.value) for elim in eliminations}
@@ -192,6 +286,44 @@ class TestDerivePointing:
             for p in elim.premises
         )
 
+    def test_pointing_skips_existing_elimination(self) -> None:
+        box = next(
+            house
+            for house in all_houses(4)
+            if house.house_type == HouseType.BOX and house.index == 0
+        )
+        row = next(
+            house
+            for house in all_houses(4)
+            if house.house_type == HouseType.ROW and house.index == 0
+        )
+        range_lemma = RangeLemma(box, 1, (Cell(0, 0), Cell(0, 1)), ())
+        lemmas = (
+            Lemma(Cell(0, 2), bitmask({1, 2, 3, 4}), ()),
+            Lemma(Cell(0, 3), bitmask({1, 2, 3, 4}), ()),
+        )
+        existing = Elimination(Cell(0, 2), 1, row, ())
+        eliminations = derive_pointing_eliminations(
+            4, lemmas, (range_lemma,), (existing,)
+        )
+        assert [(e.cell, e.value) for e in eliminations] == [(Cell(0, 3), 1)]
+
+    def test_pointing_ignores_lemma_domains(self) -> None:
+        # Only supplied eliminations suppress a target; a domain that already
+        # excludes the value does not.
+        box = next(
+            house
+            for house in all_houses(4)
+            if house.house_type == HouseType.BOX and house.index == 0
+        )
+        range_lemma = RangeLemma(box, 1, (Cell(0, 0), Cell(0, 1)), ())
+        lemmas = (
+            Lemma(Cell(0, 2), bitmask({2, 3, 4}), ()),
+            Lemma(Cell(0, 3), bitmask({1, 2, 3, 4}), ()),
+        )
+        eliminations = derive_pointing_eliminations(4, lemmas, (range_lemma,), ())
+        assert [str(e) for e in eliminations] == ["(0,2) ≠ 1", "(0,3) ≠ 1"]
+
     def test_claiming_elimination(self) -> None:
         puzzle = (
             "004678010"
@@ -235,7 +367,7 @@ class TestFullDerivation:
 
         # Cell (2,3) has domain {4}
         lemma_23 = next(lem for lem in d.lemmas if lem.cell == Cell(2, 3))
-        assert lemma_23.domain == frozenset({4})
+        assert lemma_23.domain == bitmask({4})
 
         # The full proof chain is traceable
         for elim in lemma_23.premises:
@@ -14,25 +14,26 @@ PropId = tuple[object, ...]
 
 
 def prop_id(prop: Proposition) -> PropId:
-    if isinstance(prop, Axiom):
-        return ("Axiom", prop.cell.row, prop.cell.col, prop.value)
-    if isinstance(prop, Elimination):
-        return ("Elimination", prop.cell.row, prop.cell.col, prop.value)
-    if isinstance(prop, Lemma):
-        return ("Lemma", prop.cell.row, prop.cell.col, tuple(sorted(prop.domain)))
-    if isinstance(prop, RangeLemma):
-        cells = tuple((cell.row, cell.col) for cell in prop.cells)
+    # Cells are interned with a precomputed hash, so they key IDs directly
+    # instead of being unpacked into (row, col) pairs.
+    if type(prop) is Axiom:
+        return ("Axiom", prop.cell, prop.value)
+    if type(prop) is Elimination:
+        return ("Elimination", prop.cell, prop.value)
+    if type(prop) is Lemma:
+        return ("Lemma", prop.cell, prop.domain)
+    if type(prop) is RangeLemma:
         return (
             "RangeLemma",
             prop.house.house_type,
             prop.house.index,
             prop.value,
-            cells,
+            prop.cells,
         )
-    if isinstance(prop, Candidate):
-        return ("Candidate", prop.cell.row, prop.cell.col, prop.value)
-    assert isinstance(prop, Theorem)
-    return ("Theorem", prop.cell.row, prop.cell.col, prop.value)
+    if type(prop) is Candidate:
+        return ("Candidate", prop.cell, prop.value)
+    assert type(prop) is Theorem
+    return ("Theorem", prop.cell, prop.value)
 
 
 def index_propositions(props: Iterable[Proposition]) -> dict[PropId, Proposition]:
@@ -48,18 +49,21 @@ def dedupe_propositions(props: Iterable[Proposition]) -> tuple[Proposition, ...]
 
 
 def collect_proof(root: Proposition) -> tuple[Proposition, ...]:
+    # Iterative pre-order walk: children are pushed in reverse so they pop in
+    # premise order, giving the same ordering as a recursive DFS without the
+    # per-node call overhead or recursion limit.
     ordered: list[Proposition] = []
     seen: set[PropId] = set()
+    stack: list[Proposition] = [root]
 
-    def visit(node: Proposition) -> None:
+    while stack:
+        node = stack.pop()
         pid = prop_id(node)
         if pid in seen:
-            return
+            continue
         seen.add(pid)
         ordered.append(node)
-        premises = getattr(node, "premises", ())
-        for premise in premises:
-            visit(premise)
+        premises: tuple[Proposition, ...] = getattr(node, "premises", ())
+        stack.extend(reversed(premises))
 
-    visit(root)
     return tuple(ordered)
@@ -8,6 +8,7 @@ from sudologue.proof.proposition import (
     Lemma,
     RangeLemma,
     Theorem,
+    bitmask,
 )
 
 
@@ -30,7 +31,7 @@ class TestPropId:
         assert prop_id(ax1) == prop_id(ax2)
 
     def test_theorem_ignores_rule(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         thm1 = Theorem(Cell(2, 3), 4, "naked single", (lemma,))
         thm2 = Theorem(Cell(2, 3), 4, "hidden single", (lemma,))
         assert prop_id(thm1) == prop_id(thm2)
@@ -41,8 +42,11 @@ class TestPropId:
         rl2 = RangeLemma(house, 2, (Cell(0, 1), Cell(0, 2)), ())
         assert prop_id(rl1) == prop_id(rl2)
 
+    def test_different_cells_different_id(self) -> None:
+        assert prop_id(Axiom(Cell(0, 1), 1)) != prop_id(Axiom(Cell(1, 0), 1))
+
     def test_candidate_id_stable(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         c1 = Candidate(Cell(2, 3), 4, (lemma,))
         c2 = Candidate(Cell(2, 3), 4, (lemma,))
         assert prop_id(c1) == prop_id(c2)
@@ -64,7 +68,7 @@ class TestCollectProof:
         e1 = Elimination(Cell(2, 3), 1, _col3_4x4(), (ax1,))
         e2 = Elimination(Cell(2, 3), 2, _col3_4x4(), (ax2,))
         e3 = Elimination(Cell(2, 3), 3, _row0_4x4(), (ax3,))
-        lemma = Lemma(Cell(2, 3), frozenset({4}), (e1, e2, e3))
+        lemma = Lemma(Cell(2, 3), bitmask({4}), (e1, e2, e3))
         theorem = Theorem(Cell(2, 3), 4, "naked single", (lemma,))
 
         proof = collect_proof(theorem)
@@ -74,3 +78,13 @@ class TestCollectProof:
         assert ax1 in proof
         assert ax2 in proof
         assert ax3 in proof
+
+    def test_preorder_follows_premise_order(self) -> None:
+        ax1 = Axiom(Cell(0, 3), 1)
+        ax2 = Axiom(Cell(1, 3), 2)
+        e1 = Elimination(Cell(2, 3), 1, _col3_4x4(), (ax1,))
+        e2 = Elimination(Cell(2, 3), 2, _col3_4x4(), (ax2, ax1))
+        lemma = Lemma(Cell(2, 3), bitmask({3, 4}), (e1, e2))
+        theorem = Theorem(Cell(2, 3), 4, "naked single", (lemma,))
+
+        assert collect_proof(theorem) == (theorem, lemma, e1, ax1, e2, ax2)
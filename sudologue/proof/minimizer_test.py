@@ -2,7 +2,7 @@ from sudologue.model.cell import Cell
 from sudologue.model.house import HouseType, all_houses
 from sudologue.narration.policy import Verbosity
 from sudologue.proof.minimizer import slice_proof
-from sudologue.proof.proposition import Axiom, Elimination, Lemma, Theorem
+from sudologue.proof.proposition import Axiom, Elimination, Lemma, Theorem, bitmask
 
 
 def _row2_4x4():
@@ -26,7 +26,7 @@ def _build_theorem() -> Theorem:
     e2 = Elimination(Cell(2, 3), 2, _col3_4x4(), (ax2,))
     e3 = Elimination(Cell(2, 3), 3, _row2_4x4(), (ax3,))
 
-    lemma = Lemma(Cell(2, 3), frozenset({4}), (e1, e2, e3))
+    lemma = Lemma(Cell(2, 3), bitmask({4}), (e1, e2, e3))
     return Theorem(Cell(2, 3), 4, "naked single", (lemma,))
 
 
@@ -46,3 +46,9 @@ class TestSliceProof:
         result = slice_proof(thm, Verbosity.TERSE)
         assert result[0] == thm
         assert len(result) == 2
+
+    def test_terse_slice_drops_repeated_premise(self) -> None:
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
+        thm = Theorem(Cell(2, 3), 4, "naked single", (lemma, lemma))
+        result = slice_proof(thm, Verbosity.TERSE)
+        assert result == (thm, lemma)
@@ -1,10 +1,16 @@
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import NamedTuple
 
 from sudologue.model.cell import Cell
-from sudologue.model.house import House, HouseLike
+from sudologue.model.house import House, HouseLike, HouseType
 
+# Enum hashes follow their string values and so vary with PYTHONHASHSEED;
+# cached hashes travel with pickled propositions, so hash fixed ordinals.
+_HOUSE_TYPE_ORDINAL = {house_type: i for i, house_type in enumerate(HouseType)}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Axiom:
     """A given value observed on the board. No premises."""
 
@@ -15,7 +21,7 @@ class Axiom:
         return f"{self.cell} = {self.value}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Elimination:
     """Cell cannot contain value because of a placed value in a shared house."""
 
@@ -23,6 +29,17 @@ class Elimination:
     value: int
     house: House
     premises: tuple["EliminationPremise", ...]
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            # Equal eliminations share a house, so (cell, value) packed into a
+            # small int is a valid hash and never touches House or Cell hashing.
+            cell = self.cell
+            h = (cell.row << 16) | (cell.col << 8) | self.value
+            object.__setattr__(self, "_hash", h)
+        return h
 
     def __str__(self) -> str:
         return f"{self.cell} ≠ {self.value}"
@@ -31,7 +48,7 @@ class Elimination:
 NotCandidate = Elimination
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RangeLemma:
     """Possible cells in a house for a value after eliminations."""
 
@@ -39,28 +56,87 @@ class RangeLemma:
     value: int
     cells: tuple[Cell, ...]
     premises: tuple[Elimination, ...]
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            house = self.house
+            h = hash(
+                (
+                    _HOUSE_TYPE_ORDINAL[house.house_type],
+                    house.index,
+                    self.value,
+                    self.cells,
+                )
+            )
+            object.__setattr__(self, "_hash", h)
+        return h
 
     def __str__(self) -> str:
         cells = ", ".join(str(cell) for cell in self.cells)
         return f"range of {self.house} for {self.value} = {{{cells}}}"
 
 
-@dataclass(frozen=True)
+def bitmask(values: Iterable[int]) -> int:
+    """Pack values into a domain bitmask: bit v is set iff v is in values."""
+    mask = 0
+    for value in values:
+        mask |= 1 << value
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
 class Lemma:
-    """Remaining possible values for a cell after all eliminations."""
+    """Remaining possible values for a cell after all eliminations.
+
+    The domain is a bitmask with bit v set iff v is still possible.
+    """
 
     cell: Cell
-    domain: frozenset[int]
+    domain: int
     premises: tuple[Elimination, ...]
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    _values: tuple[int, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = hash((self.cell, self.domain))
+            object.__setattr__(self, "_hash", h)
+        return h
+
+    @property
+    def values(self) -> tuple[int, ...]:
+        """Return the domain's values in ascending order.
+
+        Only the bitmask is stored; the tuple is built on first access.
+        """
+        values = self._values
+        if values is None:
+            result: list[int] = []
+            domain = self.domain
+            while domain:
+                low = domain & -domain
+                result.append(low.bit_length() - 1)
+                domain ^= low
+            values = tuple(result)
+            object.__setattr__(self, "_values", values)
+        return values
 
     def __str__(self) -> str:
-        values = sorted(self.domain)
+        values = self.values
         return f"domain of {self.cell} = {{{', '.join(str(v) for v in values)}}}"
 
 
-@dataclass(frozen=True)
-class Candidate:
-    """A possible value for a cell, derived from its domain lemma."""
+class Candidate(NamedTuple):
+    """A possible value for a cell, derived from its domain lemma.
+
+    A NamedTuple rather than a frozen dataclass: candidates and theorems are
+    built in bulk on the hot path, and tuple construction is a single C call.
+    """
 
     cell: Cell
     value: int
@@ -70,8 +146,7 @@ class Candidate:
         return f"candidate {self.cell} = {self.value}"
 
 
-@dataclass(frozen=True)
-class Theorem:
+class Theorem(NamedTuple):
     """A proven placement backed by a proof chain."""
 
     cell: Cell
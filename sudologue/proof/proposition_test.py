@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 import pytest
 
 from sudologue.model.cell import Cell
@@ -10,6 +14,7 @@ from sudologue.proof.proposition import (
     NotCandidate,
     RangeLemma,
     Theorem,
+    bitmask,
 )
 
 
@@ -71,7 +76,7 @@ class TestElimination:
             elim.value = 2  # type: ignore[misc]
 
     def test_non_axiom_premise(self) -> None:
-        lemma = Lemma(Cell(0, 1), frozenset({3, 4}), ())
+        lemma = Lemma(Cell(0, 1), bitmask({3, 4}), ())
         elim = Elimination(Cell(0, 2), 3, _row0_4x4(), (lemma,))
         assert elim.premises == (lemma,)
 
@@ -94,23 +99,41 @@ class TestLemma:
         e1 = Elimination(Cell(2, 3), 1, col, (ax1,))
         e2 = Elimination(Cell(2, 3), 2, col, (ax2,))
         e3 = Elimination(Cell(2, 3), 3, row, (ax3,))
-        lemma = Lemma(Cell(2, 3), frozenset({4}), (e1, e2, e3))
+        lemma = Lemma(Cell(2, 3), bitmask({4}), (e1, e2, e3))
         assert lemma.cell == Cell(2, 3)
-        assert lemma.domain == frozenset({4})
+        assert lemma.domain == bitmask({4})
         assert len(lemma.premises) == 3
 
     def test_str(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         assert str(lemma) == "domain of (2,3) = {4}"
 
     def test_str_multiple_values(self) -> None:
-        lemma = Lemma(Cell(1, 1), frozenset({2, 4}), ())
+        lemma = Lemma(Cell(1, 1), bitmask({2, 4}), ())
         assert str(lemma) == "domain of (1,1) = {2, 4}"
 
     def test_frozen(self) -> None:
-        lemma = Lemma(Cell(0, 0), frozenset({1, 2}), ())
+        lemma = Lemma(Cell(0, 0), bitmask({1, 2}), ())
         with pytest.raises(AttributeError):
-            lemma.domain = frozenset({1})  # type: ignore[misc]
+            lemma.domain = bitmask({1})  # type: ignore[misc]
+
+
+class TestBitmask:
+    def test_packs_values(self) -> None:
+        assert bitmask({1, 3}) == 0b1010
+        assert bitmask(()) == 0
+
+    def test_lemma_values_ascending(self) -> None:
+        lemma = Lemma(Cell(1, 1), bitmask({4, 2, 9}), ())
+        assert lemma.values == (2, 4, 9)
+
+    def test_empty_domain_has_no_values(self) -> None:
+        assert Lemma(Cell(1, 1), 0, ()).values == ()
+
+    def test_lemma_values_materialised_once(self) -> None:
+        lemma = Lemma(Cell(1, 1), bitmask({1, 2}), ())
+        assert lemma.values is lemma.values
+        assert lemma == Lemma(Cell(1, 1), bitmask({1, 2}), ())
 
 
 class TestRangeLemma:
@@ -135,19 +158,19 @@ class TestRangeLemma:
 
 class TestCandidate:
     def test_construction(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         cand = Candidate(Cell(2, 3), 4, (lemma,))
         assert cand.cell == Cell(2, 3)
         assert cand.value == 4
         assert cand.premises == (lemma,)
 
     def test_str(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         cand = Candidate(Cell(2, 3), 4, (lemma,))
         assert str(cand) == "candidate (2,3) = 4"
 
     def test_frozen(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         cand = Candidate(Cell(2, 3), 4, (lemma,))
         with pytest.raises(AttributeError):
             cand.value = 1  # type: ignore[misc]
@@ -155,7 +178,7 @@ class TestCandidate:
 
 class TestTheorem:
     def test_construction(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         thm = Theorem(Cell(2, 3), 4, "naked single", (lemma,))
         assert thm.cell == Cell(2, 3)
         assert thm.value == 4
@@ -163,17 +186,97 @@ class TestTheorem:
         assert thm.premises == (lemma,)
 
     def test_str(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         thm = Theorem(Cell(2, 3), 4, "naked single", (lemma,))
         assert str(thm) == "place 4 at (2,3)"
 
     def test_frozen(self) -> None:
-        lemma = Lemma(Cell(2, 3), frozenset({4}), ())
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
         thm = Theorem(Cell(2, 3), 4, "naked single", (lemma,))
         with pytest.raises(AttributeError):
             thm.value = 1  # type: ignore[misc]
 
 
+class TestSlots:
+    def test_propositions_have_no_instance_dict(self) -> None:
+        ax = Axiom(Cell(0, 3), 1)
+        elim = Elimination(Cell(2, 3), 1, _col3_4x4(), (ax,))
+        lemma = Lemma(Cell(2, 3), bitmask({4}), (elim,))
+        props = (
+            ax,
+            elim,
+            lemma,
+            RangeLemma(_row0_4x4(), 2, (Cell(0, 1),), ()),
+            Candidate(Cell(2, 3), 4, (lemma,)),
+            Theorem(Cell(2, 3), 4, "naked single", (lemma,)),
+        )
+        for prop in props:
+            assert not hasattr(prop, "__dict__")
+
+
+class TestHashing:
+    def test_equal_propositions_hash_equal(self) -> None:
+        ax = Axiom(Cell(0, 3), 1)
+        e1 = Elimination(Cell(2, 3), 1, _col3_4x4(), (ax,))
+        e2 = Elimination(Cell(2, 3), 1, _col3_4x4(), (ax,))
+        l1 = Lemma(Cell(2, 3), bitmask({4}), (e1,))
+        l2 = Lemma(Cell(2, 3), bitmask({4}), (e2,))
+        assert hash(e1) == hash(e2)
+        assert hash(l1) == hash(l2)
+        assert hash(Theorem(Cell(2, 3), 4, "x", (l1,))) == hash(
+            Theorem(Cell(2, 3), 4, "x", (l2,))
+        )
+
+    def test_elimination_hash_ignores_house_and_premises(self) -> None:
+        ax = Axiom(Cell(0, 3), 1)
+        e1 = Elimination(Cell(2, 3), 1, _col3_4x4(), (ax,))
+        e2 = Elimination(Cell(2, 3), 1, _row0_4x4(), ())
+        assert hash(e1) == hash(e2)
+        assert e1 != e2
+        assert len({e1, e2}) == 2
+
+    def test_hash_is_stable_across_calls(self) -> None:
+        rl = RangeLemma(_row0_4x4(), 2, (Cell(0, 1),), ())
+        assert hash(rl) == hash(rl)
+
+    def test_range_lemma_hash_independent_of_hash_seed(self) -> None:
+        script = (
+            "from sudologue.model.cell import Cell\n"
+            "from sudologue.model.house import all_houses\n"
+            "from sudologue.proof.proposition import RangeLemma\n"
+            "house = all_houses(4)[0]\n"
+            "print(hash(RangeLemma(house, 2, (Cell(0, 1),), ())))\n"
+        )
+        hashes = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                check=True,
+                env={
+                    **os.environ,
+                    "PYTHONHASHSEED": seed,
+                    "PYTHONPATH": os.pathsep.join(sys.path),
+                },
+                text=True,
+            ).stdout
+            for seed in ("1", "2")
+        }
+        assert len(hashes) == 1
+
+    def test_usable_in_set(self) -> None:
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
+        cands = {
+            Candidate(Cell(2, 3), 4, (lemma,)),
+            Candidate(Cell(2, 3), 4, (lemma,)),
+        }
+        assert len(cands) == 1
+
+    def test_hash_cache_not_in_repr(self) -> None:
+        lemma = Lemma(Cell(2, 3), bitmask({4}), ())
+        hash(lemma)
+        assert "_hash" not in repr(lemma)
+
+
 class TestProofChain:
     """Test that proof chains can be traversed from theorem to axioms."""
 
@@ -192,7 +295,7 @@ class TestProofChain:
         e2 = Elimination(Cell(2, 3), 2, col3, (ax2,))
         e3 = Elimination(Cell(2, 3), 3, row2, (ax3,))
 
-        lemma = Lemma(Cell(2, 3), frozenset({4}), (e1, e2, e3))
+        lemma = Lemma(Cell(2, 3), bitmask({4}), (e1, e2, e3))
         theorem = Theorem(Cell(2, 3), 4, "naked single", (lemma,))
 
         # Traverse: theorem -> lemma -> eliminations -> axioms
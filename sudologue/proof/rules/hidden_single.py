@@ -1,6 +1,5 @@
-from typing import Sequence
+from typing import Iterator, Sequence
 
-from sudologue.model.house import HouseType
 from sudologue.proof.engine import Derivation
 from sudologue.proof.proposition import Theorem
 
@@ -13,17 +12,15 @@ class HiddenSingle:
         return "hidden single"
 
     def apply(self, derivation: Derivation) -> Sequence[Theorem]:
-        results: list[Theorem] = []
-        if not derivation.range_lemmas:
-            return results
+        return list(self.iter_apply(derivation))
 
-        for range_lemma in derivation.range_lemmas:
-            if range_lemma.house.house_type == HouseType.CELL:
-                continue
-            if len(range_lemma.cells) == 1:
-                target = range_lemma.cells[0]
-                results.append(
-                    Theorem(target, range_lemma.value, self.name, (range_lemma,))
-                )
-
-        return results
+    def iter_apply(self, derivation: Derivation) -> Iterator[Theorem]:
+        """Yield hidden singles lazily, in the same order as apply."""
+        # Range lemmas are already per-(house, value) reductions, so a hidden
+        # single is just a house range with exactly one cell left.
+        name = self.name
+        return (
+            Theorem(range_lemma.cells[0], range_lemma.value, name, (range_lemma,))
+            for range_lemma in derivation.house_range_lemmas
+            if len(range_lemma.cells) == 1
+        )
@@ -1,8 +1,7 @@
-from typing import Sequence
+from typing import Iterator, Sequence
 
-from sudologue.model.house import HouseType
 from sudologue.proof.engine import Derivation
-from sudologue.proof.proposition import RangeLemma, Theorem
+from sudologue.proof.proposition import Theorem
 
 
 class NakedSingle:
@@ -13,21 +12,25 @@ class NakedSingle:
         return "naked single"
 
     def apply(self, derivation: Derivation) -> Sequence[Theorem]:
-        results: list[Theorem] = []
-        ranges_by_cell: dict[object, list[RangeLemma]] = {}
-
-        for range_lemma in derivation.range_lemmas:
-            if range_lemma.house.house_type != HouseType.CELL:
-                continue
-            ranges_by_cell.setdefault(range_lemma.house, []).append(range_lemma)
-
-        for _house, ranges in ranges_by_cell.items():
-            candidates = [rl for rl in ranges if rl.cells]
-            if len(candidates) != 1:
+        return list(self.iter_apply(derivation))
+
+    def iter_apply(self, derivation: Derivation) -> Iterator[Theorem]:
+        """Yield naked singles lazily, in the same order as apply."""
+        name = self.name
+        size = derivation.size
+        ranges = derivation.cell_range_lemmas
+
+        # Lemmas and cell-house ranges both follow the empty cells in scan
+        # order, size ranges per cell. A domain with exactly one bit set is
+        # the only case that can force a value, and then exactly one of the
+        # cell's ranges is non-empty.
+        for i, lemma in enumerate(derivation.lemmas):
+            domain = lemma.domain
+            if not domain or domain & (domain - 1):
                 continue
-            chosen = candidates[0]
-            excluded = tuple(rl for rl in ranges if not rl.cells)
+            start = i * size
+            cell_ranges = ranges[start : start + size]
+            chosen = next(rl for rl in cell_ranges if rl.cells)
+            excluded = tuple(rl for rl in cell_ranges if not rl.cells)
             premises = excluded or (chosen,)
-            results.append(Theorem(chosen.cells[0], chosen.value, self.name, premises))
-
-        return results
+            yield Theorem(chosen.cells[0], chosen.value, name, premises)
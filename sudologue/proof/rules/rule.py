@@ -1,4 +1,4 @@
-from typing import Protocol, Sequence
+from typing import Iterator, Protocol, Sequence, runtime_checkable
 
 from sudologue.proof.engine import Derivation
 from sudologue.proof.proposition import Elimination, Theorem
@@ -14,9 +14,20 @@ class EliminationRule(Protocol):
 
 
 class SelectionRule(Protocol):
-    """Protocol for theorem-producing selection rules."""
+    """Protocol for theorem-producing selection rules.
+
+    The solver derives once per step and hands every rule the same
+    Derivation, which is the shared context for all of that step's rules.
+    """
 
     @property
     def name(self) -> str: ...
 
     def apply(self, derivation: Derivation) -> Sequence[Theorem]: ...
+
+
+@runtime_checkable
+class LazySelectionRule(SelectionRule, Protocol):
+    """A selection rule that can also yield its theorems one at a time."""
+
+    def iter_apply(self, derivation: Derivation) -> Iterator[Theorem]: ...
@@ -0,0 +1,20 @@
+from sudologue.model.board import Board
+from sudologue.model.cell import Cell
+from sudologue.proof.engine import derive
+from sudologue.proof.proposition import Lemma, Theorem, bitmask
+from sudologue.proof.rules.naked_single import NakedSingle
+from sudologue.proof.scoring import proof_size
+
+
+class TestProofSize:
+    def test_naked_single_proof(self) -> None:
+        # Row 0 is 1,2,3,_: the theorem, three ranges, three eliminations
+        # and three axioms.
+        derivation = derive(Board.from_string("1230000000000000", size=4))
+        theorem = NakedSingle().apply(derivation)[0]
+        assert proof_size(theorem) == 10
+
+    def test_shared_premise_counted_once(self) -> None:
+        lemma = Lemma(Cell(0, 3), bitmask({4}), ())
+        theorem = Theorem(Cell(0, 3), 4, "stub", (lemma, lemma))
+        assert proof_size(theorem) == 2
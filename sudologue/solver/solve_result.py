@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
+from typing import NamedTuple
 
 from sudologue.model.board import Board
 from sudologue.proof.proposition import Theorem
@@ -10,8 +12,7 @@ class SolveStatus(Enum):
     STUCK = "stuck"
 
 
-@dataclass(frozen=True)
-class SolveStep:
+class SolveStep(NamedTuple):
     """A single solving step: the theorem proven and the resulting board."""
 
     theorem: Theorem
@@ -20,15 +21,31 @@ class SolveStep:
 
 @dataclass(frozen=True)
 class SolveResult:
-    """Complete solve trace from initial board to final state."""
+    """Complete solve trace from initial board to final state.
+
+    The trace is stored as parallel tuples of theorems and resulting boards;
+    the per-step view is only assembled when ``steps`` is read.
+    """
 
     initial: Board
-    steps: tuple[SolveStep, ...]
+    theorems: tuple[Theorem, ...]
+    boards: tuple[Board, ...]
     status: SolveStatus
     diagnosis: str | None = None
 
+    def __post_init__(self) -> None:
+        if len(self.theorems) != len(self.boards):
+            raise ValueError(
+                f"Expected one board per theorem, got {len(self.theorems)} "
+                f"theorems and {len(self.boards)} boards"
+            )
+
+    @cached_property
+    def steps(self) -> tuple[SolveStep, ...]:
+        return tuple(map(SolveStep, self.theorems, self.boards))
+
     @property
     def final_board(self) -> Board:
-        if self.steps:
-            return self.steps[-1].board
+        if self.boards:
+            return self.boards[-1]
         return self.initial
@@ -1,55 +1,107 @@
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
 
 from sudologue.model.board import Board
-from sudologue.proof.engine import derive
+from sudologue.proof.engine import Derivation, derive
 from sudologue.proof.proposition import Theorem
-from sudologue.proof.rules.rule import SelectionRule
-from sudologue.solver.solve_result import SolveResult, SolveStatus, SolveStep
+from sudologue.proof.rules.rule import LazySelectionRule, SelectionRule
+from sudologue.solver.solve_result import SolveResult, SolveStatus
+
+
+def _first(theorems: Iterable[Theorem]) -> Theorem | None:
+    """Return the first theorem, pulling nothing more from a lazy rule."""
+    return next(iter(theorems), None)
 
 
 class Solver:
-    """Solve loop: derive propositions, search for theorems, place values."""
+    """Solve loop: derive propositions, search for theorems, place values.
+
+    With ``autoreorder`` set, rules are tried in order of their success rate
+    so far in the current solve, so the rule that usually fires is tried
+    first and the others are skipped. This may change which theorem is
+    chosen at a step, but never whether one is found.
+    """
 
     def __init__(
         self,
         rules: Sequence[SelectionRule],
         scorer: Callable[[Theorem], int] | None = None,
+        autoreorder: bool = False,
     ) -> None:
         self._rules = list(rules)
-        self._scorer = scorer
+        self._autoreorder = autoreorder
+        # Without a scorer only the first theorem is used, so prefer rules'
+        # lazy iter_apply and stop each rule at its first hit.
+        self._finders: list[Callable[[Derivation], Iterable[Theorem]]] = [
+            (
+                rule.iter_apply
+                if scorer is None and isinstance(rule, LazySelectionRule)
+                else rule.apply
+            )
+            for rule in self._rules
+        ]
+        # Bind the selection strategy once rather than branching every step.
+        self._pick: Callable[[Iterable[Theorem]], Theorem | None] = (
+            _first if scorer is None else partial(min, key=scorer, default=None)
+        )
 
     def solve(self, board: Board) -> SolveResult:
-        steps: list[SolveStep] = []
+        theorems: list[Theorem] = []
+        boards: list[Board] = []
         current = board
+        pick = self._pick
+        finders = self._finders
+        autoreorder = self._autoreorder
+        order = list(range(len(finders)))
+        hits = [0] * len(finders)
+        tries = [0] * len(finders)
+
+        def success_rate(i: int) -> float:
+            return hits[i] / tries[i] if tries[i] else 0.0
 
         while not current.is_complete:
             derivation = derive(current)
             theorem = None
 
-            for rule in self._rules:
-                theorems = rule.apply(derivation)
-                if theorems:
-                    if self._scorer is None:
-                        theorem = theorems[0]
-                    else:
-                        theorem = min(theorems, key=self._scorer)
-                    break
+            if not autoreorder:
+                for find in finders:
+                    theorem = pick(find(derivation))
+                    if theorem is not None:
+                        break
+            else:
+                for i in order:
+                    tries[i] += 1
+                    theorem = pick(finders[i](derivation))
+                    if theorem is not None:
+                        hits[i] += 1
+                        break
+                # Stable sort: ties keep the caller's rule order.
+                order.sort(key=success_rate, reverse=True)
 
             if theorem is None:
                 empty_count = len(current.empty_cells)
                 return SolveResult(
                     initial=board,
-                    steps=tuple(steps),
+                    theorems=tuple(theorems),
+                    boards=tuple(boards),
                     status=SolveStatus.STUCK,
                     diagnosis=f"{empty_count} empty cells remaining",
                 )
 
-            new_board = current.place(theorem.cell, theorem.value)
-            steps.append(SolveStep(theorem=theorem, board=new_board))
-            current = new_board
+            current = current.place(theorem.cell, theorem.value)
+            theorems.append(theorem)
+            boards.append(current)
 
         return SolveResult(
             initial=board,
-            steps=tuple(steps),
+            theorems=tuple(theorems),
+            boards=tuple(boards),
             status=SolveStatus.SOLVED,
         )
+
+    def solve_all(self, boards: Iterable[Board]) -> list[SolveResult]:
+        """Solve a batch of boards, returning results in input order.
+
+        Each result's initial board is the board passed in at that position.
+        """
+        return [self.solve(board) for board in boards]
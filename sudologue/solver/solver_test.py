@@ -1,110 +1,154 @@
+from collections.abc import Iterator
+from typing import Final
+
 import pytest
 
 from sudologue.model.board import Board
 from sudologue.model.cell import Cell
 from sudologue.model.house import HouseType, all_houses
 from sudologue.proof.identity import collect_proof
-from sudologue.proof.proposition import Axiom, Elimination, Lemma, RangeLemma, Theorem
+from sudologue.proof.proposition import (
+    Axiom,
+    Elimination,
+    Lemma,
+    RangeLemma,
+    Theorem,
+    bitmask,
+)
 from sudologue.proof.rules.hidden_single import HiddenSingle
 from sudologue.proof.rules.naked_single import NakedSingle
 from sudologue.proof.scoring import proof_size
-from sudologue.solver.solve_result import SolveStatus, SolveStep
+from sudologue.solver.solve_result import SolveResult, SolveStatus, SolveStep
 from sudologue.solver.solver import Solver
 
+# Rules are stateless, so one instance serves every test.
+_NAKED_SINGLE = NakedSingle()
+_C03 = Cell(0, 3)
+_EMPTY_DIAG: Final = "16 empty cells"
+
+
+@pytest.fixture(scope="module")
+def solver() -> Solver:
+    return Solver([_NAKED_SINGLE])
+
+
+@pytest.fixture(scope="module")
+def no_rule_solver() -> Solver:
+    return Solver([])
+
+
+@pytest.fixture(scope="module")
+def board_1230() -> Board:
+    return Board.from_string("1230000000000000", size=4)
+
+
+@pytest.fixture(scope="module")
+def board_solved() -> Board:
+    return Board.from_string("1234341221434321", size=4)
+
+
+@pytest.fixture(scope="module")
+def board_empty() -> Board:
+    return Board.from_string("0000000000000000", size=4)
+
+
+@pytest.fixture(scope="module")
+def board_cascade() -> Board:
+    # 123_ / ___4 / ___1 / ___3
+    return Board.from_string("1230000400010003", size=4)
+
+
+@pytest.fixture(scope="module")
+def result_1230(solver: Solver, board_1230: Board) -> SolveResult:
+    return solver.solve(board_1230)
+
+
+@pytest.fixture(scope="module")
+def cascade_result(solver: Solver, board_cascade: Board) -> SolveResult:
+    return solver.solve(board_cascade)
+
 
 class TestSolveResult:
-    def test_final_board_with_steps(self) -> None:
-        board = Board.from_string("1230000000000000", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
+    def test_final_board_with_steps(self, result_1230: SolveResult) -> None:
         # (0,3) should be placed as 4
-        assert result.final_board.value_at(Cell(0, 3)) == 4
+        assert result_1230.final_board.value_at(_C03) == 4
 
-    def test_final_board_no_steps(self) -> None:
-        board = Board.from_string("1234341221434321", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
-        assert result.final_board is board
+    def test_final_board_no_steps(self, solver: Solver, board_solved: Board) -> None:
+        result = solver.solve(board_solved)
+        assert result.final_board is board_solved
 
-    def test_frozen(self) -> None:
-        board = Board.from_string("1234341221434321", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
+    def test_frozen(self, solver: Solver, board_solved: Board) -> None:
+        result = solver.solve(board_solved)
         with pytest.raises(AttributeError):
             result.status = SolveStatus.STUCK  # type: ignore[misc]
 
+    def test_steps_view_parallel_trace(self, result_1230: SolveResult) -> None:
+        result = result_1230
+        assert result.steps == tuple(
+            SolveStep(t, b) for t, b in zip(result.theorems, result.boards, strict=True)
+        )
+        assert result.steps is result.steps
+
+    def test_mismatched_trace_rejected(self, board_solved: Board) -> None:
+        with pytest.raises(ValueError):
+            SolveResult(board_solved, (), (board_solved,), SolveStatus.SOLVED)
+
 
 class TestSolverSingleStep:
-    def test_one_forced_cell(self) -> None:
+    def test_one_forced_cell(self, result_1230: SolveResult) -> None:
         # Row 0 has 1,2,3 -> (0,3) must be 4
-        board = Board.from_string("1230000000000000", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
         # Should have at least one step placing 4 at (0,3)
-        step_cells = {s.theorem.cell for s in result.steps}
-        assert Cell(0, 3) in step_cells
+        assert any(s.theorem.cell == _C03 for s in result_1230.steps)
 
-    def test_step_has_theorem_and_board(self) -> None:
-        board = Board.from_string("1230000000000000", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
-        step = result.steps[0]
-        assert step.theorem.cell == Cell(0, 3)
+    def test_step_has_theorem_and_board(self, result_1230: SolveResult) -> None:
+        step = result_1230.steps[0]
+        assert step.theorem.cell == _C03
         assert step.theorem.value == 4
-        assert step.board.value_at(Cell(0, 3)) == 4
+        assert step.board.value_at(_C03) == 4
 
 
 class TestSolverStuck:
-    def test_empty_board_stuck(self) -> None:
+    def test_empty_board_stuck(self, solver: Solver, board_empty: Board) -> None:
         # Empty board with naked single only -> stuck immediately
-        board = Board.from_string("0000000000000000", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
+        result = solver.solve(board_empty)
         assert result.status == SolveStatus.STUCK
         assert result.diagnosis is not None
-        assert "16 empty cells" in result.diagnosis
+        assert _EMPTY_DIAG in result.diagnosis
 
-    def test_no_rules_always_stuck(self) -> None:
-        board = Board.from_string("1230000000000000", size=4)
-        solver = Solver([])
-        result = solver.solve(board)
+    def test_no_rules_always_stuck(
+        self, no_rule_solver: Solver, board_1230: Board
+    ) -> None:
+        result = no_rule_solver.solve(board_1230)
         assert result.status == SolveStatus.STUCK
 
-    def test_stuck_preserves_initial_board(self) -> None:
-        board = Board.from_string("0000000000000000", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
-        assert result.initial is board
+    def test_stuck_preserves_initial_board(
+        self, solver: Solver, board_empty: Board
+    ) -> None:
+        result = solver.solve(board_empty)
+        assert result.initial is board_empty
 
 
 class TestSolverAlreadySolved:
-    def test_complete_board_returns_solved(self) -> None:
-        board = Board.from_string("1234341221434321", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
+    def test_complete_board_returns_solved(
+        self, solver: Solver, board_solved: Board
+    ) -> None:
+        result = solver.solve(board_solved)
         assert result.status == SolveStatus.SOLVED
         assert len(result.steps) == 0
 
 
 class TestSolverMultiStep:
-    def test_cascade_placements(self) -> None:
+    def test_cascade_placements(self, cascade_result: SolveResult) -> None:
         # A board where placing one value reveals another naked single
-        # 123_ / ___4 / ___1 / ___3
         # (0,3) forced to 4, then each step may reveal more
-        board = Board.from_string("1230000400010003", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
         # Should make progress (at least place 4 at (0,3))
-        assert len(result.steps) > 0
-        first = result.steps[0]
+        assert len(cascade_result.steps) > 0
+        first = cascade_result.steps[0]
         assert first.theorem.rule == "naked single"
 
-    def test_each_step_validates_board(self) -> None:
+    def test_each_step_validates_board(self, cascade_result: SolveResult) -> None:
         """Every intermediate board in the solve trace is valid."""
-        board = Board.from_string("1230000400010003", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
-        for step in result.steps:
+        for step in cascade_result.steps:
             # Board construction validates invariants, so if we got here
             # without an exception, the board is valid.
             assert step.board.size == 4
@@ -113,11 +157,8 @@ class TestSolverMultiStep:
 class TestSolverProofInspection:
     """Verify that theorems in the solve trace have inspectable proof chains."""
 
-    def test_all_theorems_have_premises(self) -> None:
-        board = Board.from_string("1230000400010003", size=4)
-        solver = Solver([NakedSingle()])
-        result = solver.solve(board)
-        for step in result.steps:
+    def test_all_theorems_have_premises(self, cascade_result: SolveResult) -> None:
+        for step in cascade_result.steps:
             thm = step.theorem
             assert len(thm.premises) > 0
             range_lemma = thm.premises[0]
@@ -133,15 +174,15 @@ class TestSolverScoring:
         ax1 = Axiom(Cell(0, 0), 1)
         ax2 = Axiom(Cell(0, 1), 2)
         ax3 = Axiom(Cell(0, 2), 3)
-        e1 = Elimination(Cell(0, 3), 1, house, (ax1,))
-        e2 = Elimination(Cell(0, 3), 2, house, (ax2,))
-        e3 = Elimination(Cell(0, 3), 3, house, (ax3,))
+        e1 = Elimination(_C03, 1, house, (ax1,))
+        e2 = Elimination(_C03, 2, house, (ax2,))
+        e3 = Elimination(_C03, 3, house, (ax3,))
 
-        lemma_short = Lemma(Cell(0, 3), frozenset({4}), ())
-        lemma_long = Lemma(Cell(0, 3), frozenset({4}), (e1, e2, e3))
+        lemma_short = Lemma(_C03, bitmask({4}), ())
+        lemma_long = Lemma(_C03, bitmask({4}), (e1, e2, e3))
 
-        thm_short = Theorem(Cell(0, 3), 4, "stub", (lemma_short,))
-        thm_long = Theorem(Cell(0, 3), 4, "stub", (lemma_long,))
+        thm_short = Theorem(_C03, 4, "stub", (lemma_short,))
+        thm_long = Theorem(_C03, 4, "stub", (lemma_long,))
 
         class StubRule:
             @property
@@ -157,10 +198,93 @@ class TestSolverScoring:
         assert result.steps[0].theorem is thm_short
 
 
+class TestSolverLazyRules:
+    def test_stops_at_first_lazy_theorem(self) -> None:
+        thm = Theorem(_C03, 4, "stub", ())
+
+        class LazyStubRule:
+            @property
+            def name(self) -> str:
+                return "stub"
+
+            def apply(self, derivation: object) -> list[Theorem]:
+                raise AssertionError("apply should not be called")
+
+            def iter_apply(self, derivation: object) -> Iterator[Theorem]:
+                yield thm
+                raise AssertionError("only the first theorem should be pulled")
+
+        board = Board.from_string("1230341221434321", size=4)
+        result = Solver([LazyStubRule()]).solve(board)
+        assert result.status == SolveStatus.SOLVED
+        assert result.steps[0].theorem is thm
+
+
+class TestSolverAutoreorder:
+    class EmptyRule:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @property
+        def name(self) -> str:
+            return "empty"
+
+        def apply(self, derivation: object) -> list[Theorem]:
+            self.calls += 1
+            return []
+
+    def test_successful_rule_moves_first(self) -> None:
+        board = Board.from_string("1230341221434300", size=4)
+        empty = self.EmptyRule()
+        result = Solver([empty, _NAKED_SINGLE], autoreorder=True).solve(board)
+        assert result.status == SolveStatus.SOLVED
+        assert len(result.steps) == 3
+        assert empty.calls == 1
+
+    def test_fixed_order_by_default(self) -> None:
+        board = Board.from_string("1230341221434300", size=4)
+        empty = self.EmptyRule()
+        Solver([empty, _NAKED_SINGLE]).solve(board)
+        assert empty.calls == 3
+
+    def test_same_solution_as_fixed_order(self) -> None:
+        board = Board.from_string("1234000021430320", size=4)
+        rules = [HiddenSingle(), _NAKED_SINGLE]
+        fixed = Solver(rules).solve(board)
+        reordered = Solver(rules, autoreorder=True).solve(board)
+        assert reordered.status == SolveStatus.SOLVED
+        assert reordered.final_board == fixed.final_board
+
+
+class TestSolverBatch:
+    def test_results_in_input_order(self) -> None:
+        boards = [
+            Board.from_string("1230341221434321", size=4),
+            Board.from_string("0000000000000000", size=4),
+        ]
+        solver = Solver([_NAKED_SINGLE, HiddenSingle()])
+        results = solver.solve_all(boards)
+        assert [r.initial for r in results] == boards
+        assert [r.status for r in results] == [SolveStatus.SOLVED, SolveStatus.STUCK]
+
+    def test_equal_boards_keep_their_own_initial(self) -> None:
+        boards = [
+            Board.from_string("1230341221434321", size=4),
+            Board.from_string("1230341221434321", size=4),
+        ]
+        solver = Solver([_NAKED_SINGLE, HiddenSingle()])
+        first, second = solver.solve_all(boards)
+        assert first.initial is boards[0]
+        assert second.initial is boards[1]
+
+    def test_empty_batch(self, solver: Solver) -> None:
+        assert solver.solve_all([]) == []
+
+
 class TestSolverPointingClaiming:
     def test_pointing_pair_used_in_solve(self) -> None:
         board = Board.from_string("1234000021430320", size=4)
-        solver = Solver([HiddenSingle(), NakedSingle()])
+        solver = Solver([HiddenSingle(), _NAKED_SINGLE])
         result = solver.solve(board)
         assert result.status == SolveStatus.SOLVED
 
@@ -192,7 +316,7 @@ class TestSolverPointingClaiming:
             "040286100"
         )
         board = Board.from_string(puzzle, size=9)
-        solver = Solver([HiddenSingle(), NakedSingle()])
+        solver = Solver([HiddenSingle(), _NAKED_SINGLE])
         result = solver.solve(board)
         assert result.status == SolveStatus.SOLVED
 